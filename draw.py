@@ -1,11 +1,232 @@
 import turtle as t
+from turtle import Vec2D
 from math import ceil, cos, sin, radians
-from svgpathtools import svg2paths2
+from svgpathtools import svg2paths2, Line, CubicBezier
 import numpy as np
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 
-def read_svg(path="bacho.svg", seg_unit=8):
+_FLOAT_RE = re.compile(r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?")
+_XFORM_RE = re.compile(r"(\w+)\s*\(([^)]*)\)")
+
+# SVG y-down -> turtle y-up, as a 2x3 affine (see read_svg)
+_Y_FLIP = np.array([[1.0, 0.0, 0.0],
+                    [0.0, -1.0, 0.0]])
+
+# Process pool sizing for read_svg. Sampling costs ~25 us per segment
+# in-process, while a spawned worker (Windows/macOS default) takes ~0.5-1 s to
+# start because it re-imports numpy and svgpathtools. Each worker therefore
+# needs ~25k segments (~0.6 s of work) to pay for itself.
+_SEGMENTS_PER_WORKER = 25000
+
+# Sampling grids keyed by point count; shared, so kept read-only
+_linspace_cache = {}
+
+
+def _unit_linspace(n):
+    ts = _linspace_cache.get(n)
+    if ts is None:
+        ts = np.linspace(0, 1, n, endpoint=True)
+        ts.flags.writeable = False
+        _linspace_cache[n] = ts
+    return ts
+
+
+# --- Transform utilities ---
+# Affine transforms are stored as 2x3 arrays [[a, c, e], [b, d, f]];
+# the homogeneous row [0, 0, 1] is implicit.
+def mat_identity():
+    return np.array([[1.0, 0.0, 0.0],
+                     [0.0, 1.0, 0.0]])
+
+
+# Shared identity for paths without a transform; read-only since it is reused
+_IDENTITY = mat_identity()
+_IDENTITY.flags.writeable = False
+
+
+def mat_mul(a, b):
+    m = a[:, :2] @ b
+    m[:, 2] += a[:, 2]
+    return m
+
+
+def mat_apply(m, pts):
+    return pts @ m[:, :2].T + m[:, 2]
+
+
+def mat_apply_complex(m, z):
+    """Apply `m` to complex points `z`, returning an (N, 2) float64 array.
+
+    Similarities (rotation + uniform scale, optionally mirrored, which covers
+    the Y-flipped translate/rotate/scale transforms SVG files mostly use) are a
+    single complex multiply-add; anything else goes through mat_apply.
+    """
+    (a, c, e), (b, d, f) = m.tolist()
+    if a == d and b == -c:
+        w = z*complex(a, b) + complex(e, f)
+    elif a == -d and b == c:
+        w = np.conj(z)*complex(a, b) + complex(e, f)
+    else:
+        return mat_apply(m, np.column_stack([z.real, z.imag]))
+    # complex128 is laid out as (real, imag) pairs: view it as (N, 2) floats
+    return w.view(np.float64).reshape(-1, 2)
+
+
+def parse_numbers(s):
+    return [float(v) for v in _FLOAT_RE.findall(s)]
+
+
+def _xform_matrix(name, vals):
+    """2x3 matrix for one transform function, or None if unsupported."""
+    if name == 'translate':
+        tx = vals[0] if len(vals) > 0 else 0.0
+        ty = vals[1] if len(vals) > 1 else 0.0
+        return np.array([[1,0,tx],[0,1,ty]], dtype=np.float64)
+    if name == 'scale':
+        sx = vals[0] if len(vals) > 0 else 1.0
+        sy = vals[1] if len(vals) > 1 else sx
+        return np.array([[sx,0,0],[0,sy,0]], dtype=np.float64)
+    if name == 'rotate':
+        ang = vals[0] if len(vals) > 0 else 0.0
+        cx = vals[1] if len(vals) > 2 else 0.0
+        cy = vals[2] if len(vals) > 2 else 0.0
+        a = cos(radians(ang)); b = sin(radians(ang))
+        rot = np.array([[a,-b,0],[b,a,0]], dtype=np.float64)
+        if len(vals) > 2:
+            # Translate to origin, rotate, translate back
+            return mat_mul(mat_mul(np.array([[1,0,cx],[0,1,cy]], dtype=np.float64), rot),
+                           np.array([[1,0,-cx],[0,1,-cy]], dtype=np.float64))
+        return rot
+    if name == 'matrix' and len(vals) >= 6:
+        a,b,c,d,e,f = vals[:6]
+        return np.array([[a,c,e],[b,d,f]], dtype=np.float64)
+    # Note: skewX/skewY not handled explicitly
+    return None
+
+
+def parse_transform(s):
+    if not s:
+        return _IDENTITY
+    s = s.strip()
+    # Fast path for a single function: no composition needed
+    if s.count('(') == 1:
+        match = _XFORM_RE.search(s)
+        if match:
+            tm = _xform_matrix(match.group(1).lower(), parse_numbers(match.group(2)))
+            return _IDENTITY if tm is None else tm
+    # Apply left-to-right as in SVG spec (list composes as Tn * ... * T1)
+    m = mat_identity()
+    for func, args_str in _XFORM_RE.findall(s):
+        tm = _xform_matrix(func.lower(), parse_numbers(args_str))
+        if tm is not None:
+            m = mat_mul(tm, m)
+    return m
+
+
+def _sample_run(segs, counts):
+    """Evaluate a run of same-type Line/CubicBezier segments in one pass."""
+    ts = np.concatenate([_unit_linspace(n) for n in counts])
+    P0 = np.repeat(np.array([seg.start for seg in segs]), counts)
+    P3 = np.repeat(np.array([seg.end for seg in segs]), counts)
+    if isinstance(segs[0], Line):
+        return P0 + (P3 - P0)*ts
+    P1 = np.repeat(np.array([seg.control1 for seg in segs]), counts)
+    P2 = np.repeat(np.array([seg.control2 for seg in segs]), counts)
+    # Horner form, same as CubicBezier.point
+    return P0 + ts*(3*(P1 - P0) + ts*(3*(P0 + P2) - 6*P1 + ts*(-P0 + 3*(P1 - P2) + P3)))
+
+
+def _sample_subpath(subpath, seg_unit):
+    """Sample a continuous subpath into a closed ring (first point repeated at
+    the end), batching consecutive Line/CubicBezier runs."""
+    points = []
+    run, run_counts = [], []
+    for seg in subpath:
+        interp_num = max(2, ceil(seg.length()/seg_unit))
+        if run and type(seg) is not type(run[0]):
+            points.append(_sample_run(run, run_counts))
+            run, run_counts = [], []
+        if type(seg) in (Line, CubicBezier):
+            run.append(seg)
+            run_counts.append(interp_num)
+        else:
+            # Arc / QuadraticBezier: fall back to the segment's own evaluator
+            points.append(seg.point(_unit_linspace(interp_num)))
+    if run:
+        points.append(_sample_run(run, run_counts))
+    total = sum(len(p) for p in points)
+    out = np.empty(total + 1, dtype=np.complex128)
+    np.concatenate(points, out=out[:total])
+    out[-1] = out[0]
+    return out
+
+
+def _rdp(pts, epsilon):
+    """Ramer-Douglas-Peucker simplification of an (N, 2) polyline.
+
+    Iterative, so long rings don't hit the recursion limit. Endpoints are always
+    kept, which preserves closure of closed rings.
+    """
+    n = len(pts)
+    if epsilon <= 0 or n < 4:
+        return pts
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2:
+            continue
+        a = pts[i]
+        dx, dy = pts[j] - a
+        rel = pts[i+1:j] - a
+        norm = np.hypot(dx, dy)
+        if norm == 0:
+            # Closed ring: start == end, measure plain distance from it
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(dx*rel[:, 1] - dy*rel[:, 0])/norm
+        k = int(np.argmax(dist))
+        if dist[k] > epsilon:
+            k += i + 1
+            keep[k] = True
+            stack.append((i, k))
+            stack.append((k, j))
+    if keep.sum() < 3:
+        return pts
+    return pts[keep]
+
+
+def _process_one_path(path, m, seg_unit, simplify_tol):
+    """Sample every subpath of `path`, apply the 2x3 transform `m` and
+    simplify each ring with tolerance `simplify_tol` (0 disables)."""
+    poly = []
+    for subpaths in path.continuous_subpaths():
+        points = _sample_subpath(subpaths, seg_unit)
+        # Apply transform to all points at once
+        ring = mat_apply_complex(m, points)
+        # Transform in float64, store float32: plenty for pixel coordinates
+        poly.append(_rdp(ring, simplify_tol).astype(np.float32))
+    return poly
+
+
+def _cpu_count():
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _pool_workers(num_segments):
+    """Number of worker processes worth starting, or 0 to sample in-process."""
+    workers = min(_cpu_count(), num_segments // _SEGMENTS_PER_WORKER)
+    return workers if workers > 1 else 0
+
+
+def read_svg(path="bacho.svg", seg_unit=8, simplify_tol=0):
     paths, attrs, svg_attr = svg2paths2(path)
 
     def _to_float(value, default=0.0):
@@ -51,162 +272,156 @@ def read_svg(path="bacho.svg", seg_unit=8):
             else:
                 viewbox = [min_x, min_y, max_x, max_y]
 
-    # --- Transform utilities ---
-    def mat_identity():
-        return [[1.0, 0.0, 0.0],
-                [0.0, 1.0, 0.0],
-                [0.0, 0.0, 1.0]]
-
-    def mat_mul(a, b):
-        return [
-            [a[0][0]*b[0][0] + a[0][1]*b[1][0] + a[0][2]*b[2][0],
-             a[0][0]*b[0][1] + a[0][1]*b[1][1] + a[0][2]*b[2][1],
-             a[0][0]*b[0][2] + a[0][1]*b[1][2] + a[0][2]*b[2][2]],
-            [a[1][0]*b[0][0] + a[1][1]*b[1][0] + a[1][2]*b[2][0],
-             a[1][0]*b[0][1] + a[1][1]*b[1][1] + a[1][2]*b[2][1],
-             a[1][0]*b[0][2] + a[1][1]*b[1][2] + a[1][2]*b[2][2]],
-            [a[2][0]*b[0][0] + a[2][1]*b[1][0] + a[2][2]*b[2][0],
-             a[2][0]*b[0][1] + a[2][1]*b[1][1] + a[2][2]*b[2][1],
-             a[2][0]*b[0][2] + a[2][1]*b[1][2] + a[2][2]*b[2][2]],
-        ]
-
-    def mat_apply(m, x, y):
-        nx = m[0][0]*x + m[0][1]*y + m[0][2]
-        ny = m[1][0]*x + m[1][1]*y + m[1][2]
-        return nx, ny
-
-    float_re = r"[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?"
-    def parse_numbers(s):
-        return [float(v) for v in re.findall(float_re, s)]
-
-    def parse_transform(s):
-        if not s:
-            return mat_identity()
-        s = s.strip()
-        # Apply left-to-right as in SVG spec (list composes as Tn * ... * T1)
-        m = mat_identity()
-        for func, args_str in re.findall(r"(\w+)\s*\(([^)]*)\)", s):
-            vals = parse_numbers(args_str)
-            name = func.lower()
-            tm = mat_identity()
-            if name == 'translate':
-                tx = vals[0] if len(vals) > 0 else 0.0
-                ty = vals[1] if len(vals) > 1 else 0.0
-                tm = [[1,0,tx],[0,1,ty],[0,0,1]]
-            elif name == 'scale':
-                sx = vals[0] if len(vals) > 0 else 1.0
-                sy = vals[1] if len(vals) > 1 else sx
-                tm = [[sx,0,0],[0,sy,0],[0,0,1]]
-            elif name == 'rotate':
-                ang = vals[0] if len(vals) > 0 else 0.0
-                cx = vals[1] if len(vals) > 2 else 0.0
-                cy = vals[2] if len(vals) > 2 else 0.0
-                a = cos(radians(ang)); b = sin(radians(ang))
-                if len(vals) > 2:
-                    # Translate to origin, rotate, translate back
-                    tm = mat_mul(mat_mul([[1,0,cx],[0,1,cy],[0,0,1]], [[a,-b,0],[b,a,0],[0,0,1]]), [[1,0,-cx],[0,1,-cy],[0,0,1]])
-                else:
-                    tm = [[a,-b,0],[b,a,0],[0,0,1]]
-            elif name == 'matrix' and len(vals) >= 6:
-                a,b,c,d,e,f = vals[:6]
-                tm = [[a,c,e],[b,d,f],[0,0,1]]
-            # Note: skewX/skewY not handled explicitly
-            m = mat_mul(tm, m)
-        return m
-
     # Build polygons with per-path transforms applied
-    transformed_polys = []
+    transforms = []
     new_attrs = []
+    # Parsed inline styles keyed by the raw string; exports repeat them a lot
+    style_cache = {}
     for path, attr in zip(paths, attrs):
         # Inline style -> expand
         if 'style' in attr:
-            for item in str(attr['style']).split(';'):
-                if not item:
-                    continue
-                if ':' in item:
-                    k, v = item.split(':', 1)
-                    attr[k.strip()] = v.strip()
+            style = str(attr['style'])
+            parsed = style_cache.get(style)
+            if parsed is None:
+                parsed = {}
+                for item in style.split(';'):
+                    if ':' in item:
+                        k, v = item.split(':', 1)
+                        parsed[k.strip()] = v.strip()
+                style_cache[style] = parsed
+            attr.update(parsed)
         # Default stroke
         if 'stroke' not in attr and 'fill' in attr:
             attr['stroke'] = attr['fill']
 
-        m = parse_transform(attr.get('transform', ''))
-        poly = []
-        for subpaths in path.continuous_subpaths():
-            points = []
-            for seg in subpaths:
-                interp_num = max(2, ceil(seg.length()/seg_unit))
-                points.append(seg.point(np.linspace(0, 1, interp_num, endpoint=True)))
-            points = np.concatenate(points)
-            points = np.append(points, points[0])
-            # Apply transform
-            ring = []
-            for p in points:
-                x, y = p.real, p.imag
-                x, y = mat_apply(m, x, y)
-                ring.append((x, y))
-            poly.append(ring)
-        transformed_polys.append(poly)
+        # Flip Y (SVG y-down -> turtle y-up) as part of the path transform
+        transforms.append(mat_mul(_Y_FLIP, parse_transform(attr.get('transform', ''))))
         new_attrs.append(attr)
 
+    # Sampling is independent per path; spread large files over processes
+    workers = _pool_workers(sum(len(path) for path in paths))
+    if workers:
+        # A few big chunks per worker keep the pickling round-trips down
+        chunksize = max(1, len(paths) // (workers*4))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            transformed_polys = list(ex.map(_process_one_path, paths, transforms,
+                                            repeat(seg_unit), repeat(simplify_tol),
+                                            chunksize=chunksize))
+    else:
+        transformed_polys = [_process_one_path(path, m, seg_unit, simplify_tol)
+                             for path, m in zip(paths, transforms)]
+
     return (transformed_polys, new_attrs, svg_size, viewbox)
 
 
 
 def head_to(t, x, y, draw=True, have_sprite=True):
+    # Only touch pen state / heading when they actually change; the heading
+    # only matters for the sprite
     wasdown = t.isdown()
-    heading = t.towards(x,y)
-    t.pen(pendown=draw)
-    t.seth(heading)
-    t.clearstamps()
+    if draw != wasdown:
+        t.pen(pendown=draw)
+    if have_sprite:
+        heading = t.towards(x,y)
+        if heading != t.heading():
+            t.seth(heading)
+        t.clearstamps()
     t.goto(x,y)
-    t.stamp()
-    t.pen(pendown=wasdown)
-
-
-
-def draw_polygon(t, poly, fill='black', stroke='black', have_sprite=True):
-    if fill=='none':
-        fill = 'black'
-    t.color(stroke,fill)
-    p = poly[0]
-    head_to(t,p[0],-(p[1]), False, have_sprite)
-    for p in poly[1:]: 
-        head_to(t,p[0],-(p[1]), have_sprite=have_sprite)
+    if have_sprite:
+        t.stamp()
+    if draw != wasdown:
+        t.pen(pendown=wasdown)
+
+
+
+def draw_polygon(t, poly, fill='black', stroke='black', have_sprite=True, set_color=True):
+    if set_color:
+        if fill=='none':
+            fill = 'black'
+        t.color(stroke,fill)
+    x0, y0 = poly[0].tolist()
+    head_to(t,x0,y0, False, have_sprite)
+
+    pts = poly[1:].tolist()
+    if not pts:
+        t.up()
+        return
+
+    # Draw the ring with screen updates suspended; restoring the tracer
+    # afterwards refreshes the canvas once for the whole ring.
+    screen = t.getscreen()
+    tracing = screen.tracer()
+    screen.tracer(0)
+    t.down()
+    _goto = getattr(t.getturtle(), '_goto', None)
+    if _goto is not None:
+        for x, y in pts[:-1]:
+            _goto(Vec2D(x, y))
+    else:
+        goto = t.goto
+        for x, y in pts[:-1]:
+            goto(x, y)
+    # Last vertex goes through head_to so the sprite ends up oriented and stamped
+    x, y = pts[-1]
+    head_to(t, x, y, True, have_sprite)
+    screen.tracer(tracing)
     t.up()
 
 
-def draw_multipolygon(t, mpoly, fill='black', stroke='black', have_sprite=True):
-    p = mpoly[0][0]
-    head_to(t,p[0],-(p[1]), False, have_sprite)
+def draw_multipolygon(t, mpoly, fill='black', stroke='black', have_sprite=True, set_color=True):
+    if set_color:
+        t.color(stroke, fill if fill!='none' else 'black')
+    x0, y0 = mpoly[0][0].tolist()
+    t.up()
+    t.goto(x0, y0)
     if fill!='none':
         t.begin_fill()
+    last = len(mpoly) - 1
     for i, poly in enumerate(mpoly):
-        draw_polygon(t, poly, fill, stroke, have_sprite)
-        if i!=0:
-            head_to(t,p[0],-(p[1]), False, have_sprite)
+        draw_polygon(t, poly, fill, stroke, have_sprite, set_color=False)
+        # Plain pen-up hop back to the outer ring's start between holes, so the
+        # fill path doesn't pick up area between them; end_fill closes the last.
+        if 0 < i < last:
+            t.goto(x0, y0)
     if fill!="none":
         t.end_fill()
 
 
+def draw_multipolygon_canvas(canvas, mpoly, scale, fill='black', stroke='black', width=1):
+    """Render a multipolygon straight onto the turtle canvas.
+
+    One Tk item per ring (plus one fill polygon) instead of a turtle move per
+    vertex. `scale` maps world coordinates to canvas coordinates.
+    """
+    rings = [(ring*scale).ravel().tolist() for ring in mpoly]
+    if fill!='none':
+        # Same fill path draw_multipolygon builds: hop back to the outer start
+        # between holes
+        x0, y0 = rings[0][:2]
+        coords = list(rings[0])
+        last = len(rings) - 1
+        for i, ring in enumerate(rings[1:], 1):
+            coords.extend(ring)
+            if i < last:
+                coords.extend((x0, y0))
+        canvas.create_polygon(coords, fill=fill, outline='')
+    for ring in rings:
+        canvas.create_line(ring, fill=stroke, width=width, capstyle='round')
+
+
 def compute_bounds(polys):
-    min_x = float('inf')
-    min_y = float('inf')
-    max_x = float('-inf')
-    max_y = float('-inf')
-    for mpoly in polys:
-        for ring in mpoly:
-            for x, y in ring:
-                if x < min_x: min_x = x
-                if x > max_x: max_x = x
-                if y < min_y: min_y = y
-                if y > max_y: max_y = y
-    if min_x == float('inf'):
+    rings = [ring for mpoly in polys for ring in mpoly]
+    if not rings:
         return [0.0, 0.0, 1000.0, 1000.0]
-    return [min_x, min_y, max_x, max_y]
+    all_pts = np.concatenate(rings, axis=0)
+    if len(all_pts) == 0:
+        return [0.0, 0.0, 1000.0, 1000.0]
+    mins = all_pts.min(axis=0)
+    maxs = all_pts.max(axis=0)
+    return [float(mins[0]), float(mins[1]), float(maxs[0]), float(maxs[1])]
 
 
-def main():
+def main(use_canvas=True):
     polys, attrs, svg_size, viewbox = read_svg()
 
     # Prefer original width/height if provided to preserve aspect/position
@@ -214,7 +429,9 @@ def main():
     if width > 0 and height > 0:
         vb = [0.0, 0.0, width, height]
     else:
-        vb = compute_bounds(polys)
+        # Polygons are already Y-flipped; convert bounds back to SVG orientation
+        bx0, by0, bx1, by1 = compute_bounds(polys)
+        vb = [bx0, -by1, bx1, -by0]
 
     vb_w = max(vb[2]-vb[0], 1e-6)
     vb_h = max(vb[3]-vb[1], 1e-6)
@@ -240,25 +457,55 @@ def main():
     t.setworldcoordinates(llx, lly, urx, ury)
 
     t.mode(mode='world')
-    t.tracer(n=10, delay=0)
-
-    # Draw in original document order
-    for poly, attr in zip(polys, attrs):
-        t.pen(outline=0.5)
-        if 'stroke-width' in attr:
-            try:
-                t.pen(outline=float(attr['stroke-width']), pencolor='black')  # type: ignore
-            except Exception:
-                pass
-
-        fill = attr.get('fill', 'none')
-        stroke = attr.get('stroke', 'black')
-        draw_multipolygon(t, poly, fill=fill, stroke=stroke)
-
-    t.tracer(n=1, delay=0)
-    t.clearstamps()
-    t.penup()
 
+    # World -> canvas scale: setworldcoordinates maps the world window onto the
+    # whole canvas (screensize), with canvas y pointing down
+    canv_w, canv_h = window.screensize()
+    scale = np.array([canv_w/(urx - llx), -canv_h/(ury - lly)])
+
+    if use_canvas:
+        # Bulk render on the Tk canvas; turtle only set up the screen
+        canvas = window.getcanvas()
+        pensize = t.pensize()
+        window.tracer(0)
+        for poly, attr in zip(polys, attrs):
+            fill = attr.get('fill', 'none')
+            stroke = attr.get('stroke', 'black')
+            draw_multipolygon_canvas(canvas, poly, scale, fill=fill, stroke=stroke, width=pensize)
+        window.tracer(1)
+        t.penup()
+    else:
+        t.tracer(n=10, delay=0)
+        # The turtle pays per vertex, so simplify rings to half a screen pixel
+        simplify_tol = 0.5/np.abs(scale).min()
+
+        # Draw in original document order; only touch pen/colors when the style
+        # differs from the previous path's
+        last_style = None
+        for poly, attr in zip(polys, attrs):
+            outline = 0.5
+            if 'stroke-width' in attr:
+                try:
+                    outline = float(attr['stroke-width'])
+                except Exception:
+                    pass
+
+            fill = attr.get('fill', 'none')
+            stroke = attr.get('stroke', 'black')
+            style = (fill, stroke, outline)
+            if style != last_style:
+                t.pen(outline=outline)
+                t.color(stroke, fill if fill!='none' else 'black')
+                last_style = style
+            poly = [_rdp(ring, simplify_tol) for ring in poly]
+            draw_multipolygon(t, poly, fill=fill, stroke=stroke, set_color=False)
+
+        t.tracer(n=1, delay=0)
+        t.clearstamps()
+        t.penup()
+
+    # Keep the window open until the user closes it
+    t.done()
 
 if __name__ == '__main__':
     main()